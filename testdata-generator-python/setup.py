@@ -32,6 +32,9 @@ setup(
         "click>=8.1.0",
         "pyyaml>=6.0.0",
     ],
+    extras_require={
+        "fast": ["numpy>=1.22", "orjson>=3.9"],
+    },
     entry_points={
         "console_scripts": [
             "testdata=testdata_generator.cli:main",
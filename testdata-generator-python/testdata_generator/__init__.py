@@ -8,8 +8,15 @@ Usage:
     users = gen.generate('user', count=10)
 """
 
-from .generator import TestDataGenerator
 from .formatters import JSONFormatter, CSVFormatter, SQLFormatter
 
 __version__ = "1.0.0"
 __all__ = ["TestDataGenerator", "JSONFormatter", "CSVFormatter", "SQLFormatter"]
+
+
+def __getattr__(name):
+    # Import the generator (and Faker) only when it is first used
+    if name == "TestDataGenerator":
+        from .generator import TestDataGenerator
+        return TestDataGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,12 +11,18 @@ Usage:
 
 import click
 import json
+import os
 import sys
-from pathlib import Path
+from itertools import chain, islice
 
-from .generator import TestDataGenerator
+from .generator_meta import TEMPLATES, get_template_schema
 from .formatters import get_formatter
 
+# Field listing shown for each template by `testdata templates`
+_TEMPLATE_DISPLAY: dict[str, str] = {
+    name: ', '.join(schema.keys()) for name, schema in TEMPLATES.items()
+}
+
 
 @click.group()
 @click.version_option(version='1.0.0', prog_name='testdata')
@@ -63,8 +69,10 @@ def cli():
               type=click.Choice(['standard', 'mysql', 'postgresql']),
               help='SQL dialect')
 @click.option('--compact', is_flag=True, help='Compact JSON output (no indentation)')
+@click.option('--workers', type=click.IntRange(min=1), 
+              help='Worker processes for large counts (50,000+ records, capped at CPU count)')
 def generate(template, count, output_format, output, schema, schema_file, 
-             seed, locale, table, dialect, compact):
+             seed, locale, table, dialect, compact, workers):
     """
     Generate test data using templates or custom schemas.
     
@@ -72,6 +80,8 @@ def generate(template, count, output_format, output, schema, schema_file,
     
     Use --schema or --schema-file for custom data shapes.
     """
+    from .generator import TestDataGenerator
+    
     try:
         # Initialize generator
         gen = TestDataGenerator(locale=locale, seed=seed)
@@ -91,27 +101,42 @@ def generate(template, count, output_format, output, schema, schema_file,
                 click.echo(f"  - {t}", err=True)
             sys.exit(1)
         
-        # Generate data
-        data = gen.generate_from_schema(data_schema, count=count)
-        
         # Format output
         formatter_kwargs = {}
         if output_format == 'json':
             formatter_kwargs['indent'] = 0 if compact else 2
-            formatter_kwargs['single_object'] = (count == 1)
         elif output_format == 'sql':
             formatter_kwargs['table_name'] = table
             formatter_kwargs['dialect'] = dialect
         
         formatter = get_formatter(output_format, **formatter_kwargs)
-        result = formatter.format(data)
+        
+        # A single JSON record is written as a bare object, not a one-item array
+        single = count == 1 and output_format == 'json'
+        
+        # Generate data lazily so large counts are streamed, not held in memory,
+        # unless the count is large enough to be split across worker processes
+        if single:
+            record = gen.generate_one_from_schema(data_schema)
+        elif TestDataGenerator.runs_parallel(count, workers):
+            data = gen.generate_from_schema(data_schema, count=count, workers=workers)
+        else:
+            data = gen.iter_from_schema(data_schema, count=count)
+            # Pull the first batch now so generation errors surface before any output
+            data = chain(list(islice(data, 1)), data)
+        
+        def write_output(stream):
+            if single:
+                stream.write(formatter.format_single(record) + '\n')
+            else:
+                formatter.write(data, stream)
         
         # Output
         if output:
-            Path(output).write_text(result)
+            _write_file(output, write_output)
             click.echo(f"Generated {count} record(s) -> {output}", err=True)
         else:
-            click.echo(result)
+            write_output(sys.stdout)
             
     except json.JSONDecodeError as e:
         click.echo(f"Error parsing JSON schema: {e}", err=True)
@@ -124,15 +149,24 @@ def generate(template, count, output_format, output, schema, schema_file,
         sys.exit(1)
 
 
+def _write_file(path, write_output):
+    """Write output to a temporary file, replacing `path` only on success."""
+    partial_path = f"{path}.part"
+    try:
+        with open(partial_path, 'w', encoding='utf-8', newline='') as f:
+            write_output(f)
+        os.replace(partial_path, path)
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+
+
 @cli.command()
 def templates():
     """List all available data templates."""
-    gen = TestDataGenerator()
-    
     click.echo("Available Templates:\n")
-    for name in gen.list_templates():
-        schema = gen.get_template_schema(name)
-        fields = ', '.join(schema.keys())
+    for name, fields in _TEMPLATE_DISPLAY.items():
         click.echo(f"  {click.style(name, fg='green', bold=True)}")
         click.echo(f"    Fields: {fields}\n")
 
@@ -140,8 +174,6 @@ def templates():
 @cli.command()
 def fields():
     """List all available field types."""
-    gen = TestDataGenerator()
-    
     field_categories = {
         'Identity': ['uuid', 'first_name', 'last_name', 'name', 'user_name', 'password'],
         'Contact': ['email', 'company_email', 'phone'],
@@ -174,10 +206,8 @@ def fields():
 @click.argument('template')
 def schema(template):
     """Show the schema for a specific template."""
-    gen = TestDataGenerator()
-    
     try:
-        template_schema = gen.get_template_schema(template)
+        template_schema = get_template_schema(template)
         click.echo(json.dumps(template_schema, indent=2))
     except ValueError as e:
         click.echo(f"Error: {e}", err=True)
@@ -189,6 +219,8 @@ def schema(template):
 @click.option('-n', '--count', default=3, help='Number of example records')
 def example(template, count):
     """Show example output for a template."""
+    from .generator import TestDataGenerator
+    
     gen = TestDataGenerator(seed=42)  # Fixed seed for consistent examples
     
     try:
@@ -5,13 +5,27 @@ Output formatters for test data in various formats.
 import json
 import csv
 import io
-from typing import Any
+from itertools import chain
+from typing import Any, Callable, Iterable, TextIO
 from abc import ABC, abstractmethod
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; JSON output falls back to the json module
+    orjson = None
+
+# Bound once to skip the module attribute lookup when flattening nested cells
+_json_dumps = json.dumps
+
+# Placeholder for "no more rows" when peeking into a record iterator
+_EMPTY = object()
+
 
 class BaseFormatter(ABC):
     """Base class for all formatters."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def format(self, data: list[dict]) -> str:
         """Format the data into a string representation."""
@@ -21,15 +35,27 @@ class BaseFormatter(ABC):
     def extension(self) -> str:
         """Return the file extension for this format."""
         pass
+    
+    def write(self, data: Iterable[dict], stream: TextIO) -> None:
+        """
+        Write formatted data to a text stream, ending with a newline.
+        
+        Subclasses override this to stream rows one at a time; the default
+        materializes the data and writes the output of format().
+        """
+        text = self.format(list(data))
+        stream.write(text if text.endswith('\n') else text + '\n')
 
 
 class JSONFormatter(BaseFormatter):
     """Format data as JSON."""
     
+    __slots__ = ('indent', 'single_object')
+    
     def __init__(self, indent: int = 2, single_object: bool = False):
         """
         Args:
-            indent: JSON indentation level
+            indent: JSON indentation level (0 or None for compact output)
             single_object: If True and data has 1 item, output object instead of array
         """
         self.indent = indent
@@ -37,8 +63,63 @@ class JSONFormatter(BaseFormatter):
     
     def format(self, data: list[dict]) -> str:
         if self.single_object and len(data) == 1:
-            return json.dumps(data[0], indent=self.indent, default=str)
-        return json.dumps(data, indent=self.indent, default=str)
+            return self._dumps(data[0])
+        return self._dumps(data)
+    
+    def format_single(self, record: dict) -> str:
+        """Format one record as a JSON object rather than an array."""
+        return self._dumps(record)
+    
+    def write(self, data: Iterable[dict], stream: TextIO) -> None:
+        rows = iter(data)
+        first = next(rows, _EMPTY)
+        if first is _EMPTY:
+            stream.write('[]\n')
+            return
+        
+        if self.single_object:
+            second = next(rows, _EMPTY)
+            if second is _EMPTY:
+                stream.write(self._dumps(first) + '\n')
+                return
+            rows = chain((first, second), rows)
+        else:
+            rows = chain((first,), rows)
+        
+        # Lay out each row exactly as _dumps() would inside the array
+        if not self.indent:
+            opening, separator, closing, pad = '[', ',', ']', None
+        else:
+            pad = '\n' + ' ' * self.indent
+            opening, separator, closing = '[' + pad, ',' + pad, '\n]'
+        
+        stream.write(opening)
+        for i, row in enumerate(rows):
+            if i:
+                stream.write(separator)
+            text = self._dumps(row)
+            stream.write(text.replace('\n', pad) if pad else text)
+        stream.write(closing + '\n')
+    
+    def _dumps(self, obj: Any) -> str:
+        """
+        Serialize to JSON, using orjson when installed.
+        
+        Non-ASCII text is written as-is (not \\u-escaped) on both paths, and
+        values orjson cannot encode (e.g. ints wider than 64 bits) fall
+        back to the json module.
+        """
+        if orjson is not None and self.indent in (None, 0, 2):
+            option = orjson.OPT_NON_STR_KEYS
+            if self.indent:
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(obj, default=str, option=option).decode()
+            except orjson.JSONEncodeError:
+                pass
+        if not self.indent:
+            return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=str)
+        return json.dumps(obj, indent=self.indent, ensure_ascii=False, default=str)
     
     def extension(self) -> str:
         return '.json'
@@ -47,37 +128,50 @@ class JSONFormatter(BaseFormatter):
 class CSVFormatter(BaseFormatter):
     """Format data as CSV."""
     
+    __slots__ = ('delimiter', 'include_header')
+    
     def __init__(self, delimiter: str = ',', include_header: bool = True):
         self.delimiter = delimiter
         self.include_header = include_header
     
     def format(self, data: list[dict]) -> str:
-        if not data:
-            return ''
-        
         output = io.StringIO()
-        fieldnames = list(data[0].keys())
-        writer = csv.DictWriter(
-            output, 
-            fieldnames=fieldnames, 
+        self.write(data, output)
+        return output.getvalue().strip()
+    
+    def write(self, data: Iterable[dict], stream: TextIO) -> None:
+        rows = iter(data)
+        first = next(rows, _EMPTY)
+        if first is _EMPTY:
+            return
+        
+        columns = list(first.keys())
+        writer = csv.writer(
+            stream, 
             delimiter=self.delimiter,
             quoting=csv.QUOTE_MINIMAL
         )
         
         if self.include_header:
-            writer.writeheader()
+            writer.writerow(columns)
         
-        for row in data:
-            # Flatten any nested structures for CSV
-            flat_row = {k: self._flatten_value(v) for k, v in row.items()}
-            writer.writerow(flat_row)
+        column_set = set(columns)
+        flatten = self._flatten_value
         
-        return output.getvalue().strip()
+        for row in chain((first,), rows):
+            # Match csv.DictWriter: missing keys are blank, unknown keys are an error
+            if row.keys() != column_set:
+                extra = row.keys() - column_set
+                if extra:
+                    raise ValueError("dict contains fields not in fieldnames: "
+                                     + ", ".join(repr(k) for k in extra))
+            # Flatten any nested structures for CSV
+            writer.writerow([flatten(row.get(c)) for c in columns])
     
     def _flatten_value(self, value: Any) -> str:
         """Convert complex values to strings for CSV output."""
         if isinstance(value, (list, dict)):
-            return json.dumps(value)
+            return _json_dumps(value)
         return value
     
     def extension(self) -> str:
@@ -87,6 +181,8 @@ class CSVFormatter(BaseFormatter):
 class SQLFormatter(BaseFormatter):
     """Format data as SQL INSERT statements."""
     
+    __slots__ = ('table_name', 'dialect')
+    
     def __init__(self, table_name: str = 'test_data', dialect: str = 'standard'):
         """
         Args:
@@ -97,20 +193,24 @@ class SQLFormatter(BaseFormatter):
         self.dialect = dialect
     
     def format(self, data: list[dict]) -> str:
-        if not data:
-            return ''
+        output = io.StringIO()
+        self.write(data, output)
+        return output.getvalue().rstrip('\n')
+    
+    def write(self, data: Iterable[dict], stream: TextIO) -> None:
+        rows = iter(data)
+        first = next(rows, _EMPTY)
+        if first is _EMPTY:
+            return
         
-        statements = []
-        columns = list(data[0].keys())
+        columns = list(first.keys())
         column_list = ', '.join(self._quote_identifier(c) for c in columns)
+        prefix = f"INSERT INTO {self._quote_identifier(self.table_name)} ({column_list}) VALUES ("
+        formatters = [(c, self._column_formatter(first[c])) for c in columns]
         
-        for row in data:
-            values = [self._format_value(row.get(c)) for c in columns]
-            value_list = ', '.join(values)
-            stmt = f"INSERT INTO {self._quote_identifier(self.table_name)} ({column_list}) VALUES ({value_list});"
-            statements.append(stmt)
-        
-        return '\n'.join(statements)
+        for row in chain((first,), rows):
+            value_list = ', '.join([fmt(row.get(c)) for c, fmt in formatters])
+            stream.write(prefix + value_list + ');\n')
     
     def _quote_identifier(self, identifier: str) -> str:
         """Quote an identifier based on dialect."""
@@ -120,6 +220,27 @@ class SQLFormatter(BaseFormatter):
             return f'"{identifier}"'
         return identifier
     
+    def _column_formatter(self, sample: Any) -> Callable[[Any], str]:
+        """
+        Build a value formatter specialized for the type of `sample`.
+        
+        Values of any other type (e.g. NULLs) go through _format_value().
+        """
+        if isinstance(sample, bool):
+            format_typed = lambda v: 'TRUE' if v else 'FALSE'
+        elif isinstance(sample, (int, float)):
+            format_typed = str
+        elif isinstance(sample, str):
+            format_typed = lambda v: "'" + v.replace("'", "''") + "'"
+        elif isinstance(sample, (list, dict)):
+            format_typed = lambda v: f"'{_json_dumps(v)}'"
+        else:
+            return self._format_value
+        
+        sample_type = type(sample)
+        format_value = self._format_value
+        return lambda v: format_typed(v) if type(v) is sample_type else format_value(v)
+    
     def _format_value(self, value: Any) -> str:
         """Format a value for SQL insertion."""
         if value is None:
@@ -130,7 +251,7 @@ class SQLFormatter(BaseFormatter):
             return str(value)
         if isinstance(value, (list, dict)):
             # JSON for complex types
-            return f"'{json.dumps(value)}'"
+            return f"'{_json_dumps(value)}'"
         # String - escape single quotes
         escaped = str(value).replace("'", "''")
         return f"'{escaped}'"
@@ -142,6 +263,8 @@ class SQLFormatter(BaseFormatter):
 class YAMLFormatter(BaseFormatter):
     """Format data as YAML."""
     
+    __slots__ = ()
+    
     def format(self, data: list[dict]) -> str:
         try:
             import yaml
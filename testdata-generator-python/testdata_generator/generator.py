@@ -3,11 +3,111 @@ Core test data generator with built-in templates and custom field support.
 """
 
 from faker import Faker
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache, partial
+from itertools import repeat
+import os
 import random
+import string
 import uuid
 
+from . import generator_meta
+from .generator_meta import TEMPLATES
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; bulk columns fall back to `random`
+    np = None
+
+
+# Byte translation tables that stamp the UUID version (4) and RFC 4122 variant bits
+_UUID_VERSION_TABLE = bytes((b & 0x0F) | 0x40 for b in range(256))
+_UUID_VARIANT_TABLE = bytes((b & 0x3F) | 0x80 for b in range(256))
+
+
+def _uuid4_batch(count: int) -> list[str]:
+    """Generate `count` UUID4 strings from a single os.urandom() buffer."""
+    buf = bytearray(os.urandom(16 * count))
+    buf[6::16] = buf[6::16].translate(_UUID_VERSION_TABLE)
+    buf[8::16] = buf[8::16].translate(_UUID_VARIANT_TABLE)
+    hx = buf.hex()
+    return [
+        f'{hx[i:i + 8]}-{hx[i + 8:i + 12]}-{hx[i + 12:i + 16]}-{hx[i + 16:i + 20]}-{hx[i + 20:i + 32]}'
+        for i in range(0, 32 * count, 32)
+    ]
+
+
+def _iso8601_batch(count: int) -> list[str]:
+    """Stamp every row in a batch with the same current UTC time."""
+    return [datetime.utcnow().isoformat() + 'Z'] * count
+
+
+def _timestamp_batch(count: int) -> list[int]:
+    """Stamp every row in a batch with the same current Unix timestamp."""
+    return [int(datetime.utcnow().timestamp())] * count
+
+
+# Pattern placeholders with a fixed alphabet, as interpreted by Faker's bothify()
+_PATTERN_ALPHABETS = {
+    '#': string.digits,
+    '%': '123456789',
+    '$': '23456789',
+    '?': string.ascii_letters,
+}
+
+
+def _pattern_batch(pattern: str) -> Callable[[int], list[str]] | None:
+    """
+    Compile a bothify() pattern into a bulk column generator.
+    
+    Every placeholder becomes a format slot filled from its own column of
+    random characters. Returns None for patterns using the optional-digit
+    placeholders ('!', '@'), which are left to bothify().
+    """
+    if '!' in pattern or '@' in pattern:
+        return None
+    
+    alphabets = [_PATTERN_ALPHABETS[c] for c in pattern if c in _PATTERN_ALPHABETS]
+    if not alphabets:
+        return lambda count: [pattern] * count
+    
+    template = ''.join(
+        '{}' if c in _PATTERN_ALPHABETS else c.replace('{', '{{').replace('}', '}}')
+        for c in pattern
+    )
+    
+    def batch(count: int) -> list[str]:
+        slots = [random.choices(alphabet, k=count) for alphabet in alphabets]
+        return [template.format(*chars) for chars in zip(*slots)]
+    
+    return batch
+
+
+# Bounds of the integer ranges numpy can draw from
+_INT64_MIN, _INT64_MAX = -2**63, 2**63 - 1
+
+# Largest scaled magnitude numpy's round() handles exactly (2**53)
+_NUMPY_ROUND_LIMIT = float(2**53)
+
+# Faker instances shared by all generators, keyed by locale
+_FAKER_CACHE: dict[str, Faker] = {}
+
+# Rows generated per batch when streaming records with iter_from_schema()
+_STREAM_BATCH_SIZE = 1000
+
+# Minimum record count before generate_from_schema() fans out to worker processes
+_PARALLEL_THRESHOLD = 50_000
+
+
+# Field types with a bulk column generator, keyed by field type name
+_COLUMN_TYPES: dict[str, Callable[[int], list]] = {
+    'uuid': _uuid4_batch,
+    'iso8601': _iso8601_batch,
+    'timestamp': _timestamp_batch,
+}
+
 
 class TestDataGenerator:
     """
@@ -25,65 +125,10 @@ class TestDataGenerator:
         }, count=10)
     """
     
+    __slots__ = ('fake', '_locale', '_seed', '_rng', '_type_map', '_compiled_templates')
+    
     # Built-in templates for common test data scenarios
-    TEMPLATES = {
-        'user': {
-            'id': 'uuid',
-            'first_name': 'first_name',
-            'last_name': 'last_name',
-            'email': 'email',
-            'phone': 'phone',
-            'created_at': 'datetime',
-        },
-        'address': {
-            'street': 'street_address',
-            'city': 'city',
-            'state': 'state',
-            'zip_code': 'zipcode',
-            'country': 'country',
-        },
-        'payment': {
-            'card_number': 'credit_card_number',
-            'card_type': 'credit_card_provider',
-            'expiry': 'credit_card_expire',
-            'cvv': 'credit_card_security_code',
-        },
-        'product': {
-            'id': 'uuid',
-            'name': 'word',
-            'description': 'sentence',
-            'price': {'type': 'decimal', 'min': 1, 'max': 1000, 'precision': 2},
-            'sku': 'ean13',
-            'in_stock': 'boolean',
-        },
-        'order': {
-            'order_id': 'uuid',
-            'customer_email': 'email',
-            'total': {'type': 'decimal', 'min': 10, 'max': 5000, 'precision': 2},
-            'status': {'type': 'choice', 'values': ['pending', 'processing', 'shipped', 'delivered', 'cancelled']},
-            'created_at': 'datetime',
-        },
-        'api_response': {
-            'request_id': 'uuid',
-            'timestamp': 'iso8601',
-            'status_code': {'type': 'choice', 'values': [200, 201, 400, 404, 500]},
-            'latency_ms': {'type': 'integer', 'min': 10, 'max': 2000},
-        },
-        'login': {
-            'username': 'user_name',
-            'password': 'password',
-            'email': 'email',
-        },
-        'employee': {
-            'employee_id': {'type': 'pattern', 'pattern': 'EMP-####'},
-            'first_name': 'first_name',
-            'last_name': 'last_name',
-            'email': 'company_email',
-            'department': {'type': 'choice', 'values': ['Engineering', 'QA', 'Product', 'Design', 'HR', 'Finance']},
-            'hire_date': 'past_date',
-            'salary': {'type': 'decimal', 'min': 50000, 'max': 200000, 'precision': 2},
-        },
-    }
+    TEMPLATES = TEMPLATES
     
     def __init__(self, locale: str = 'en_US', seed: int | None = None):
         """
@@ -93,79 +138,96 @@ class TestDataGenerator:
             locale: Faker locale for localized data (e.g., 'en_US', 'en_GB', 'de_DE')
             seed: Random seed for reproducible data generation
         """
-        self.fake = Faker(locale)
+        if locale not in _FAKER_CACHE:
+            _FAKER_CACHE[locale] = Faker(locale)
+        self.fake = _FAKER_CACHE[locale]
+        self._locale = locale
+        self._seed = seed
         if seed is not None:
             Faker.seed(seed)
             random.seed(seed)
+        # PCG64 stream for bulk numeric columns, independent of `random` and Faker.
+        # PCG64 only takes non-negative seeds, so negative ones are wrapped.
+        if np is not None:
+            np_seed = seed % 2**128 if seed is not None and seed < 0 else seed
+            self._rng = np.random.Generator(np.random.PCG64(np_seed))
+        else:
+            self._rng = None
         
-        # Map field types to generator functions
-        self._type_map: dict[str, Callable] = {
+        self._type_map = self._build_type_map(self.fake)
+        self._compiled_templates: dict[str, list] = {}
+    
+    @staticmethod
+    @cache
+    def _build_type_map(fake: Faker) -> dict[str, Callable]:
+        """Map field types to generator functions bound to a Faker instance."""
+        return {
             # Identity
             'uuid': lambda: str(uuid.uuid4()),
-            'first_name': self.fake.first_name,
-            'last_name': self.fake.last_name,
-            'name': self.fake.name,
-            'user_name': self.fake.user_name,
-            'password': lambda: self.fake.password(length=12, special_chars=True),
+            'first_name': fake.first_name,
+            'last_name': fake.last_name,
+            'name': fake.name,
+            'user_name': fake.user_name,
+            'password': lambda: fake.password(length=12, special_chars=True),
             
             # Contact
-            'email': self.fake.email,
-            'company_email': self.fake.company_email,
-            'phone': self.fake.phone_number,
+            'email': fake.email,
+            'company_email': fake.company_email,
+            'phone': fake.phone_number,
             
             # Address
-            'street_address': self.fake.street_address,
-            'city': self.fake.city,
-            'state': self.fake.state,
-            'zipcode': self.fake.zipcode,
-            'country': self.fake.country,
-            'address': self.fake.address,
+            'street_address': fake.street_address,
+            'city': fake.city,
+            'state': fake.state,
+            'zipcode': fake.zipcode,
+            'country': fake.country,
+            'address': fake.address,
             
             # Payment
-            'credit_card_number': self.fake.credit_card_number,
-            'credit_card_provider': self.fake.credit_card_provider,
-            'credit_card_expire': self.fake.credit_card_expire,
-            'credit_card_security_code': self.fake.credit_card_security_code,
+            'credit_card_number': fake.credit_card_number,
+            'credit_card_provider': fake.credit_card_provider,
+            'credit_card_expire': fake.credit_card_expire,
+            'credit_card_security_code': fake.credit_card_security_code,
             
             # Date/Time
-            'datetime': lambda: self.fake.date_time_this_year().isoformat(),
+            'datetime': lambda: fake.date_time_this_year().isoformat(),
             'iso8601': lambda: datetime.utcnow().isoformat() + 'Z',
-            'date': lambda: self.fake.date_this_year().isoformat(),
-            'past_date': lambda: self.fake.past_date().isoformat(),
-            'future_date': lambda: self.fake.future_date().isoformat(),
+            'date': lambda: fake.date_this_year().isoformat(),
+            'past_date': lambda: fake.past_date().isoformat(),
+            'future_date': lambda: fake.future_date().isoformat(),
             'timestamp': lambda: int(datetime.utcnow().timestamp()),
             
             # Text
-            'word': self.fake.word,
-            'sentence': self.fake.sentence,
-            'paragraph': self.fake.paragraph,
-            'text': lambda: self.fake.text(max_nb_chars=200),
+            'word': fake.word,
+            'sentence': fake.sentence,
+            'paragraph': fake.paragraph,
+            'text': lambda: fake.text(max_nb_chars=200),
             
             # Numbers
             'integer': lambda: random.randint(1, 1000),
-            'boolean': self.fake.boolean,
+            'boolean': fake.boolean,
             
             # Identifiers
-            'ean13': self.fake.ean13,
-            'isbn13': self.fake.isbn13,
+            'ean13': fake.ean13,
+            'isbn13': fake.isbn13,
             
             # Network
-            'ipv4': self.fake.ipv4,
-            'ipv6': self.fake.ipv6,
-            'url': self.fake.url,
-            'domain': self.fake.domain_name,
-            'mac_address': self.fake.mac_address,
+            'ipv4': fake.ipv4,
+            'ipv6': fake.ipv6,
+            'url': fake.url,
+            'domain': fake.domain_name,
+            'mac_address': fake.mac_address,
             
             # Company
-            'company': self.fake.company,
-            'job_title': self.fake.job,
+            'company': fake.company,
+            'job_title': fake.job,
         }
     
-    def _generate_field(self, field_spec: str | dict) -> Any:
-        """Generate a single field value based on its specification."""
+    def _compile_field(self, field_spec: str | dict) -> Callable[[], Any]:
+        """Compile a field specification into a zero-argument value generator."""
         if isinstance(field_spec, str):
             if field_spec in self._type_map:
-                return self._type_map[field_spec]()
+                return self._type_map[field_spec]
             raise ValueError(f"Unknown field type: {field_spec}")
         
         if isinstance(field_spec, dict):
@@ -174,59 +236,212 @@ class TestDataGenerator:
             if field_type == 'integer':
                 min_val = field_spec.get('min', 0)
                 max_val = field_spec.get('max', 100)
-                return random.randint(min_val, max_val)
+                return partial(random.randint, min_val, max_val)
             
             elif field_type == 'decimal':
                 min_val = field_spec.get('min', 0)
                 max_val = field_spec.get('max', 100)
                 precision = field_spec.get('precision', 2)
-                value = random.uniform(min_val, max_val)
-                return round(value, precision)
+                return lambda: round(random.uniform(min_val, max_val), precision)
             
             elif field_type == 'choice':
-                values = field_spec.get('values', [])
-                return random.choice(values) if values else None
+                values = tuple(field_spec.get('values', []))
+                return partial(random.choice, values) if values else lambda: None
             
             elif field_type == 'pattern':
-                pattern = field_spec.get('pattern', '')
-                return self.fake.bothify(pattern)
+                return partial(self.fake.bothify, field_spec.get('pattern', ''))
             
             elif field_type == 'list':
-                item_spec = field_spec.get('item')
+                item = self._compile_field(field_spec.get('item'))
                 count = field_spec.get('count', 3)
-                return [self._generate_field(item_spec) for _ in range(count)]
+                return lambda: [item() for _ in range(count)]
             
             else:
                 raise ValueError(f"Unknown field type: {field_type}")
         
         raise ValueError(f"Invalid field specification: {field_spec}")
     
-    def generate_from_schema(self, schema: dict, count: int = 1) -> list[dict]:
+    def _compile_column(self, field_spec: str | dict) -> Callable[[int], list] | None:
+        """
+        Compile a field specification into a bulk column generator.
+        
+        Returns a callable taking a row count and returning that many values,
+        or None if the field has no faster path than calling its generator
+        once per row.
+        """
+        if isinstance(field_spec, str):
+            return _COLUMN_TYPES.get(field_spec)
+        
+        if not isinstance(field_spec, dict):
+            return None
+        
+        field_type = field_spec.get('type')
+        rng = self._rng
+        
+        if field_type == 'integer':
+            min_val = field_spec.get('min', 0)
+            max_val = field_spec.get('max', 100)
+            # numpy draws are limited to int64; wider ranges stay on `random`
+            if rng is not None and _INT64_MIN <= min_val and max_val <= _INT64_MAX:
+                return lambda count: rng.integers(min_val, max_val, size=count, endpoint=True).tolist()
+            # Otherwise random.randint per row: exact for any range, ValueError on min > max
+            return None
+        
+        if field_type == 'decimal' and rng is not None:
+            min_val = field_spec.get('min', 0)
+            max_val = field_spec.get('max', 100)
+            precision = field_spec.get('precision', 2)
+            # ndarray.round() scales by 10**precision, so only use numpy while the
+            # scaled values stay exact; reversed or huge bounds use random.uniform
+            if (min_val <= max_val and precision <= 15
+                    and max(abs(min_val), abs(max_val)) * 10.0 ** precision < _NUMPY_ROUND_LIMIT):
+                return lambda count: rng.uniform(min_val, max_val, size=count).round(precision).tolist()
+        
+        if field_type == 'choice':
+            values = tuple(field_spec.get('values', []))
+            if not values:
+                return lambda count: [None] * count
+            if rng is not None:
+                # Filled item by item so list/dict values stay single elements
+                pool = np.empty(len(values), dtype=object)
+                for i, value in enumerate(values):
+                    pool[i] = value
+                return lambda count: pool[rng.integers(0, len(pool), size=count)].tolist()
+            return lambda count: random.choices(values, k=count)
+        
+        if field_type == 'pattern':
+            return _pattern_batch(field_spec.get('pattern', ''))
+        
+        return None
+    
+    def _compile_schema(self, schema: dict) -> list[tuple[str, Callable[[], Any], Callable[[int], list] | None]]:
+        """Compile a schema into (field_name, generator, column_generator) triples."""
+        return [
+            (name, self._compile_field(spec), self._compile_column(spec))
+            for name, spec in schema.items()
+        ]
+    
+    def _generate_records(self, compiled: list, count: int) -> list[dict]:
+        """Generate `count` records column by column from a compiled schema."""
+        # Column generators (os.urandom, numpy) reject negative sizes
+        count = max(count, 0)
+        if not compiled:
+            return [{} for _ in range(count)]
+        names = [name for name, _, _ in compiled]
+        columns = [
+            column(count) if column is not None else [fn() for _ in range(count)]
+            for _, fn, column in compiled
+        ]
+        # map() keeps the row assembly loop in C rather than in bytecode
+        return list(map(dict, map(zip, repeat(names), zip(*columns))))
+    
+    def _iter_records(self, compiled: list, count: int) -> Iterator[dict]:
+        """Yield `count` records from a compiled schema in fixed-size batches."""
+        remaining = count
+        while remaining > 0:
+            batch = min(remaining, _STREAM_BATCH_SIZE)
+            yield from self._generate_records(compiled, batch)
+            remaining -= batch
+    
+    def _generate_parallel(self, schema: dict, count: int, workers: int) -> list[dict]:
+        """Split generation across worker processes, each with its own seed."""
+        workers = min(workers, os.cpu_count() or 1)
+        shard_size, extra = divmod(count, workers)
+        counts = [shard_size + (i < extra) for i in range(workers)]
+        
+        # Always seed shards: forked workers would otherwise share RNG state
+        base_seed = self._seed if self._seed is not None else int.from_bytes(os.urandom(4), 'big')
+        seeds = [base_seed + i for i in range(workers)]
+        
+        records = [None] * count
+        offset = 0
+        with ProcessPoolExecutor(workers) as executor:
+            for shard in executor.map(_generate_shard, repeat(schema), counts, repeat(self._locale), seeds):
+                records[offset:offset + len(shard)] = shard
+                offset += len(shard)
+        return records
+    
+    @staticmethod
+    def runs_parallel(count: int, workers: int | None) -> bool:
+        """
+        Return whether generating `count` records with `workers` uses worker processes.
+        
+        Workers are capped at the CPU count, and only batches of at least
+        50,000 records are split.
+        """
+        return (workers is not None and min(workers, os.cpu_count() or 1) > 1
+                and count >= _PARALLEL_THRESHOLD)
+    
+    def _generate_compiled(self, schema: dict, compiled: list, count: int, workers: int | None) -> list[dict]:
+        """Generate records from an already compiled schema."""
+        if self.runs_parallel(count, workers):
+            return self._generate_parallel(schema, count, workers)
+        # Same batch sequence as iter_from_schema(), so seeded output matches
+        return list(self._iter_records(compiled, count))
+    
+    def generate_from_schema(self, schema: dict, count: int = 1, workers: int | None = None) -> list[dict]:
         """
         Generate data from a custom schema.
         
+        Values are generated column by column: the schema is compiled once
+        up front, then columns are filled in batches of 1000 rows, the same
+        sequence iter_from_schema() uses, so both yield identical seeded data.
+        
         Args:
             schema: Dictionary mapping field names to field types/specs
             count: Number of records to generate
+            workers: Number of processes to split large batches across
+                (capped at the CPU count; used only when `count` is at least
+                50,000). Each worker derives its own seed, so seeded parallel
+                output differs from seeded single-process output.
             
         Returns:
             List of generated records
         """
-        records = []
-        for _ in range(count):
-            record = {}
-            for field_name, field_spec in schema.items():
-                record[field_name] = self._generate_field(field_spec)
-            records.append(record)
-        return records
+        return self._generate_compiled(schema, self._compile_schema(schema), count, workers)
+    
+    def generate_one_from_schema(self, schema: dict) -> dict:
+        """
+        Generate a single record from a custom schema.
+        
+        Uses the same column generators as generate_from_schema(), so a
+        seeded generator yields the same record either way.
+        
+        Args:
+            schema: Dictionary mapping field names to field types/specs
+            
+        Returns:
+            The generated record
+        """
+        return self._generate_records(self._compile_schema(schema), 1)[0]
     
-    def generate(self, template_name: str, count: int = 1) -> list[dict]:
+    def iter_from_schema(self, schema: dict, count: int = 1) -> Iterator[dict]:
+        """
+        Lazily generate data from a custom schema.
+        
+        Records are produced in small batches, so memory use stays flat no
+        matter how large `count` is. The schema is validated immediately.
+        
+        Args:
+            schema: Dictionary mapping field names to field types/specs
+            count: Number of records to generate
+            
+        Returns:
+            Iterator over generated records
+        """
+        return self._iter_records(self._compile_schema(schema), count)
+    
+    def generate(self, template_name: str, count: int = 1, workers: int | None = None) -> list[dict]:
         """
         Generate data using a built-in template.
         
         Args:
             template_name: Name of the template ('user', 'address', 'payment', etc.)
             count: Number of records to generate
+            workers: Number of processes to split large batches across
+                (capped at the CPU count; used only when `count` is at least
+                50,000). Seeded parallel output differs from seeded
+                single-process output.
             
         Returns:
             List of generated records
@@ -235,18 +450,29 @@ class TestDataGenerator:
             available = ', '.join(self.TEMPLATES.keys())
             raise ValueError(f"Unknown template: {template_name}. Available: {available}")
         
-        return self.generate_from_schema(self.TEMPLATES[template_name], count)
+        # Built-in templates never change, so their compiled form is reused
+        schema = self.TEMPLATES[template_name]
+        compiled = self._compiled_templates.get(template_name)
+        if compiled is None:
+            compiled = self._compiled_templates[template_name] = self._compile_schema(schema)
+        
+        return self._generate_compiled(schema, compiled, count, workers)
     
-    def list_templates(self) -> list[str]:
+    @staticmethod
+    def list_templates() -> list[str]:
         """Return list of available template names."""
-        return list(self.TEMPLATES.keys())
+        return generator_meta.list_templates()
     
     def list_field_types(self) -> list[str]:
         """Return list of available field types."""
         return list(self._type_map.keys())
     
-    def get_template_schema(self, template_name: str) -> dict:
+    @staticmethod
+    def get_template_schema(template_name: str) -> dict:
         """Return the schema for a specific template."""
-        if template_name not in self.TEMPLATES:
-            raise ValueError(f"Unknown template: {template_name}")
-        return self.TEMPLATES[template_name].copy()
+        return generator_meta.get_template_schema(template_name)
+
+
+def _generate_shard(schema: dict, count: int, locale: str, seed: int) -> list[dict]:
+    """Generate one shard of records in a worker process."""
+    return TestDataGenerator(locale=locale, seed=seed).generate_from_schema(schema, count)
@@ -0,0 +1,75 @@
+"""
+Template metadata, kept free of heavy imports so it loads instantly.
+"""
+
+# Built-in templates for common test data scenarios
+TEMPLATES = {
+    'user': {
+        'id': 'uuid',
+        'first_name': 'first_name',
+        'last_name': 'last_name',
+        'email': 'email',
+        'phone': 'phone',
+        'created_at': 'datetime',
+    },
+    'address': {
+        'street': 'street_address',
+        'city': 'city',
+        'state': 'state',
+        'zip_code': 'zipcode',
+        'country': 'country',
+    },
+    'payment': {
+        'card_number': 'credit_card_number',
+        'card_type': 'credit_card_provider',
+        'expiry': 'credit_card_expire',
+        'cvv': 'credit_card_security_code',
+    },
+    'product': {
+        'id': 'uuid',
+        'name': 'word',
+        'description': 'sentence',
+        'price': {'type': 'decimal', 'min': 1, 'max': 1000, 'precision': 2},
+        'sku': 'ean13',
+        'in_stock': 'boolean',
+    },
+    'order': {
+        'order_id': 'uuid',
+        'customer_email': 'email',
+        'total': {'type': 'decimal', 'min': 10, 'max': 5000, 'precision': 2},
+        'status': {'type': 'choice', 'values': ['pending', 'processing', 'shipped', 'delivered', 'cancelled']},
+        'created_at': 'datetime',
+    },
+    'api_response': {
+        'request_id': 'uuid',
+        'timestamp': 'iso8601',
+        'status_code': {'type': 'choice', 'values': [200, 201, 400, 404, 500]},
+        'latency_ms': {'type': 'integer', 'min': 10, 'max': 2000},
+    },
+    'login': {
+        'username': 'user_name',
+        'password': 'password',
+        'email': 'email',
+    },
+    'employee': {
+        'employee_id': {'type': 'pattern', 'pattern': 'EMP-####'},
+        'first_name': 'first_name',
+        'last_name': 'last_name',
+        'email': 'company_email',
+        'department': {'type': 'choice', 'values': ['Engineering', 'QA', 'Product', 'Design', 'HR', 'Finance']},
+        'hire_date': 'past_date',
+        'salary': {'type': 'decimal', 'min': 50000, 'max': 200000, 'precision': 2},
+    },
+}
+
+
+def list_templates() -> list[str]:
+    """Return list of available template names."""
+    return list(TEMPLATES.keys())
+
+
+def get_template_schema(template_name: str) -> dict:
+    """Return the schema for a specific template."""
+    if template_name not in TEMPLATES:
+        raise ValueError(f"Unknown template: {template_name}")
+    return TEMPLATES[template_name].copy()